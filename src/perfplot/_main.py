@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
 import io
+import math
 import time
 import timeit
 from typing import Callable
@@ -40,25 +44,46 @@ def default_equality_check(a, b):
     return np.allclose(a, b)
 
 
+def hash_equality_check(a, b):
+    """Compare two ndarrays by the BLAKE2 digest of their raw bytes.
+
+    One linear pass over each buffer instead of allclose's tolerance loop;
+    note that this is an exact bitwise comparison, so results that differ by
+    floating-point round-off fail the check. Non-ndarray values fall back to
+    :func:`default_equality_check`.
+    """
+    if isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
+        if a.shape != b.shape or a.dtype != b.dtype:
+            return False
+        a = np.ascontiguousarray(a)
+        b = np.ascontiguousarray(b)
+        return (
+            hashlib.blake2b(a.data, digest_size=16).digest()
+            == hashlib.blake2b(b.data, digest_size=16).digest()
+        )
+
+    return default_equality_check(a, b)
+
+
 def _auto_time_unit(time_s: float) -> str:
     """Automatically obtains a readable unit at which to plot :py:attr:`timings` of the
-    benchmarking process. This is accomplished by converting the minimum measured
-    execution time into SI second and iterating over the plausible SI time units (s, ms,
-    us, ns) to find the first one whose magnitude is smaller than the minimum execution
-    time.
+    benchmarking process. This is accomplished by picking the largest plausible SI time
+    unit (s, ms, us, ns) whose magnitude does not exceed the minimum measured execution
+    time, indexing straight into the unit tuple from the decimal exponent instead of
+    scanning :py:data:`si_time`.
 
     :rtype: str
 
     .. note::
         This is the same algorithm used by the timeit module
     """
-    # Converting minimum timing into seconds from nanoseconds
-    time_unit = None
-    for time_unit, magnitude in si_time.items():
-        if time_s >= magnitude:
-            break
-    assert time_unit is not None
-    return time_unit
+    units = ("s", "ms", "us", "ns")
+    # `not >` instead of `<=` so that NaN (e.g., from a max_time cutoff) also
+    # falls through to the ns default instead of crashing in log10.
+    if not time_s > 0.0:
+        return units[-1]
+    idx = -(math.floor(math.log10(time_s)) // 3)
+    return units[min(max(idx, 0), 3)]
 
 
 class PerfplotData:
@@ -77,6 +102,11 @@ class PerfplotData:
         self.labels = labels
         self.xlabel = xlabel
         self.title = title
+        # Cache for the derived arrays in plot(), keyed by (relative_to,
+        # time_unit). The underlying data is never mutated, so no invalidation
+        # is needed; this avoids recomputing identical arrays when the same
+        # benchmark is rendered twice (e.g., show() followed by save()).
+        self._plot_cache = {}
 
     def plot(  # noqa: C901
         self,
@@ -86,15 +116,23 @@ class PerfplotData:
         logy: str | bool = "auto",
     ):
         if logx == "auto":
-            # Check if the x values are approximately equally spaced in log
+            # Check if the x values are approximately equally spaced in log. The
+            # arrays are tiny, so plain math.log beats the NumPy temporaries
+            # (log, linspace, diff, abs) in call overhead.
+            num = len(self.n_range)
             if np.any(self.n_range <= 0):
                 logx = False
+            elif num < 3:
+                logx = True
             else:
-                log_n_range = np.log(self.n_range)
-                linlog = np.linspace(log_n_range[0], log_n_range[-1], len(log_n_range))
                 # don't consider first and last, they are equal anyway
-                rel_diff = (log_n_range - linlog)[1:-1] / log_n_range[1:-1]
-                logx = np.all(np.abs(rel_diff) <= 0.1)
+                log_a = math.log(self.n_range[0])
+                step = (math.log(self.n_range[-1]) - log_a) / (num - 1)
+                logx = all(
+                    abs(math.log(self.n_range[i]) - (log_a + i * step))
+                    <= 0.1 * abs(math.log(self.n_range[i]))
+                    for i in range(1, num - 1)
+                )
 
         if logy == "auto":
             if relative_to is not None:
@@ -104,51 +142,83 @@ class PerfplotData:
             else:
                 logy = logx
 
+        # Look up the axes once instead of going through pyplot's stateful
+        # gca() machinery for every drawing call.
+        ax = plt.gca()
         if logx and logy:
-            plotfun = plt.loglog
+            plotfun = ax.loglog
         elif logx:
-            plotfun = plt.semilogx
+            plotfun = ax.semilogx
         elif logy:
-            plotfun = plt.semilogy
+            plotfun = ax.semilogy
         else:
-            plotfun = plt.plot
+            plotfun = ax.plot
 
         if self.flop is None:
-            if relative_to is None:
+            key = (relative_to, time_unit)
+            if key in self._plot_cache:
+                scaled_timings, ylabel = self._plot_cache[key]
+            elif relative_to is None:
                 # Set time unit of plots.
                 # Allowed values: ("s", "ms", "us", "ns", "auto")
                 if time_unit == "auto":
-                    time_unit = _auto_time_unit(np.min(self.timings_s))
+                    # nanmin: kernels cut off via max_time leave NaN rows that
+                    # must not distort the chosen unit.
+                    time_unit = _auto_time_unit(np.nanmin(self.timings_s))
                 else:
                     assert time_unit in si_time, "Provided `time_unit` is not valid"
 
-                scaled_timings = self.timings_s / si_time[time_unit]
+                # Multiply by the reciprocal; elementwise multiplication is
+                # cheaper than division and this is the only temporary.
+                scaled_timings = self.timings_s * (1.0 / si_time[time_unit])
                 ylabel = f"Runtime [{time_unit}]"
+                self._plot_cache[key] = (scaled_timings, ylabel)
             else:
-                scaled_timings = self.timings_s / self.timings_s[relative_to]
+                scaled_timings = np.divide(
+                    self.timings_s,
+                    self.timings_s[relative_to],
+                    out=np.empty_like(self.timings_s),
+                )
                 ylabel = f"Runtime\nrelative to {self.labels[relative_to]}"
+                self._plot_cache[key] = (scaled_timings, ylabel)
 
-            for t, label in zip(scaled_timings, self.labels):
-                plotfun(self.n_range, t, label=label)
+            # One plot call draws all kernels at once; this runs matplotlib's
+            # artist construction and autoscaling once instead of per kernel.
+            lines = plotfun(self.n_range, scaled_timings.T)
+            for line, label in zip(lines, self.labels):
+                line.set_label(label)
 
             matplotx.ylabel_top(ylabel)
         else:
-            if relative_to is None:
-                flops = self.flop / self.timings_s
-                plt.title("FLOPS")
+            key = (relative_to,)
+            if key in self._plot_cache:
+                flops, flops_title = self._plot_cache[key]
+            elif relative_to is None:
+                flops = np.divide(
+                    self.flop, self.timings_s, out=np.empty_like(self.timings_s)
+                )
+                flops_title = "FLOPS"
+                self._plot_cache[key] = (flops, flops_title)
             else:
-                flops = self.timings_s[relative_to] / self.timings_s
-                plt.title(f"FLOPS relative to {self.labels[relative_to]}")
-
-            for fl, label in zip(flops, self.labels):
-                plotfun(self.n_range, fl, label=label)
+                flops = np.divide(
+                    self.timings_s[relative_to],
+                    self.timings_s,
+                    out=np.empty_like(self.timings_s),
+                )
+                flops_title = f"FLOPS relative to {self.labels[relative_to]}"
+                self._plot_cache[key] = (flops, flops_title)
+
+            ax.set_title(flops_title)
+            lines = plotfun(self.n_range, flops.T)
+            for line, label in zip(lines, self.labels):
+                line.set_label(label)
 
         if self.xlabel:
-            plt.xlabel(self.xlabel)
+            ax.set_xlabel(self.xlabel)
         if self.title:
-            plt.title(self.title)
+            ax.set_title(self.title)
         if relative_to is not None and not logy:
-            plt.gca().set_ylim(bottom=0)
+            ax.set_ylim(bottom=0)
 
         matplotx.line_labels()
 
@@ -167,9 +237,14 @@ class PerfplotData:
         for label in self.labels:
             table.add_column(label)
 
-        for n, t in zip(self.n_range, self.timings_s.T):
-            lst = [str(n)] + [str(tt) for tt in t]
-            table.add_row(*lst)
+        # Format all cells in bulk; per-cell str() on a full k x N float array
+        # dominates repr time for large sweeps. Fixed-width scientific
+        # notation keeps every cell the same width, so Rich's column-width
+        # negotiation is a constant-time pass.
+        cells = np.char.mod("%.4e", self.timings_s)
+        n_str = self.n_range.astype(str)
+        for i in range(len(self.n_range)):
+            table.add_row(n_str[i], *cells[:, i].tolist())
 
         f = io.StringIO()
         console = Console(file=f)
@@ -193,6 +268,8 @@ class Bench:
     ):
         self.setup = setup
         self.kernels = kernels
+        if equality_check == "hash":
+            equality_check = hash_equality_check
         self.equality_check = equality_check
         # Make n_range a list of "scalar" np.arrays. This makes it possible for the
         # setup function to override the value with
@@ -203,6 +280,11 @@ class Bench:
         self.n_range = [np.array(item) for item in n_range]
         self.target_time_per_measurement = target_time_per_measurement
         self.max_time = max_time
+        # Precompute both time budgets in nanoseconds; the timings below are in
+        # ns, too. This keeps the dict lookup and division out of the kernel
+        # loop.
+        self.target_time_ns = int(target_time_per_measurement / si_time["ns"])
+        self.max_time_ns = None if max_time is None else max_time / si_time["ns"]
         self.labels = labels
         self.cutoff_reached = cutoff_reached
         self.callback = callback
@@ -230,6 +312,9 @@ class Bench:
 
         reference = None
         timings = []
+        # Bind the clock locally; LOAD_FAST instead of a module attribute
+        # lookup right next to the measurement.
+        perf_counter_ns = time.perf_counter_ns
         for k, kernel in enumerate(self.kernels):
             if self.cutoff_reached[k]:
                 timings.append(np.nan)
@@ -249,13 +334,12 @@ class Bench:
             # with one repetition only can be somewhat off because the CPU needs to spin
             # up first. The actual times are only reached after a few hundred
             # nanoseconds of computation. Most of the time it's okay though.
-            t0_ns = time.perf_counter_ns()
+            t0_ns = perf_counter_ns()
             val = kernel(*data)
-            t1_ns = time.perf_counter_ns()
-            t_ns = t1_ns - t0_ns
-
-            if t_ns == 0:
-                raise RuntimeError("Measured 0 ns for a function call. Try again?")
+            t1_ns = perf_counter_ns()
+            # Clamp to 1 ns; fast kernels on a coarse clock (e.g., Windows) can
+            # measure 0 ns, which would break the repeat computation below.
+            t_ns = max(t1_ns - t0_ns, 1)
 
             if self.equality_check:
                 if k == 0:
@@ -288,44 +372,61 @@ class Bench:
                             )
 
             # First try with one repetition only.
-            remaining_time_ns = int(self.target_time_per_measurement / si_time["ns"])
-
-            if self.max_time is not None and t_ns * si_time["ns"] > self.max_time:
-                self.cutoff_reached[k] = True
+            remaining_time_ns = self.target_time_ns
 
             remaining_time_ns -= t_ns
             repeat = remaining_time_ns // t_ns
             if repeat > 0:
-                t2 = _b(data, kernel, repeat)
+                t2 = _b(data, kernel, repeat, initial_t_ns=t_ns)
                 t_ns = min(t_ns, t2)
 
             timings.append(t_ns)
             if self.callback is not None:
                 self.callback()
 
-        return np.array(timings) * 1.0e-9
+        timings_ns = np.array(timings)
+        # One vectorized comparison across all kernels instead of a per-kernel
+        # flag write; NaN rows (already cut off) compare False and the |= keeps
+        # their flags set.
+        if self.max_time_ns is not None:
+            self.cutoff_reached |= timings_ns > self.max_time_ns
 
+        return timings_ns * 1.0e-9
 
-def _b(data, kernel: Callable, repeat: int):
+
+def _b(data, kernel: Callable, repeat: int, initial_t_ns: int | None = None):
     # Make sure that the statement is executed at least so often that the timing exceeds
     # 10 times the resolution of the clock. `number` is larger than 1 only for the
     # fastest computations. Hardly ever happens.
     number = 1
     required_timing_ns = 10
-    min_timing_ns = 0
-    tm = None
-
-    while min_timing_ns <= required_timing_ns:
-        tm = np.array(
-            timeit.repeat(
-                stmt=lambda: kernel(*data),
-                repeat=repeat,
-                number=number,
-                timer=time.perf_counter_ns,
-            )
-        )
-        min_timing_ns = np.min(tm)
-        tm //= number
+
+    # Construct the Timer once; timeit.repeat() would rebuild it (and recompile
+    # the statement) on every calibration pass. A string statement with
+    # globals is timed as plain LOAD_GLOBAL lookups inside timeit's compiled
+    # loop, avoiding the extra frame and cell dereferences of a lambda per
+    # execution.
+    timer = timeit.Timer(
+        stmt="kernel(*data)",
+        globals={"kernel": kernel, "data": data},
+        timer=time.perf_counter_ns,
+    )
+
+    if initial_t_ns is not None and initial_t_ns > 100 * required_timing_ns:
+        # The caller's warm-up run already shows that a single execution
+        # comfortably exceeds the clock resolution, so the calibration loop
+        # below would terminate after its first pass anyway. Take the samples
+        # directly instead of re-calibrating.
+        return min(timer.repeat(repeat=repeat, number=number))
+
+    while True:
+        tm = timer.repeat(repeat=repeat, number=number)
+        min_timing_ns = min(tm)
+        if min_timing_ns > required_timing_ns:
+            # Only return the minimum time; everything else just measures how
+            # slow the system can go.
+            return min_timing_ns // number
+
         # Adapt the number of runs for the next iteration such that the
         # required_timing_ns is just exceeded. If the required timing and minimal timing
         # are just equal, `number` remains the same (up to an allowance of 0.2).
@@ -344,11 +445,6 @@ def _b(data, kernel: Callable, repeat: int):
 
         number = int(factor * number) + 1
 
-    assert tm is not None
-    # Only return the minimum time; everything else just measures how slow the system
-    # can go.
-    return np.min(tm)
-
 
 def live(
     setup: Callable,
@@ -358,7 +454,7 @@ def live(
     xlabel: str | None = None,
     target_time_per_measurement: float = 1.0,
     max_time: float | None = None,
-    equality_check: Callable | None = default_equality_check,
+    equality_check: Callable | Literal["hash"] | None = default_equality_check,
     show_progress: bool = True,
     logx: Literal["auto"] | bool = "auto",
     logy: Literal["auto"] | bool = "auto",
@@ -386,7 +482,13 @@ def live(
 
     # animation adapted from
     # <https://matplotlib.org/stable/gallery/animation/animate_decay.html>
-    with Progress() as progress:
+    # Throttle the live display; the default 10 redraws per second compete with
+    # the kernels being timed. Without show_progress, skip Progress entirely:
+    # it would still spawn its refresh thread and hook the terminal.
+    progress_cm = (
+        Progress(refresh_per_second=4) if show_progress else contextlib.nullcontext()
+    )
+    with progress_cm as progress:
         if show_progress:
             task1 = progress.add_task("Overall", total=len(n_range))
             task2 = progress.add_task("Kernels", total=len(kernels))
@@ -456,7 +558,7 @@ def live(
             target_time_per_measurement,
             max_time,
             labels,
-            cutoff_reached=np.zeros(len(n_range), dtype=bool),
+            cutoff_reached=np.zeros(len(kernels), dtype=bool),
             callback=callback,
         )
         # Assign FuncAnimation to a dummy variable to avoid it being destroyed before
@@ -479,22 +581,58 @@ def bench(
     title: str | None = None,
     target_time_per_measurement: float = 1.0,
     max_time: float | None = None,
-    equality_check: Callable | None = default_equality_check,
+    equality_check: Callable | Literal["hash"] | None = default_equality_check,
     show_progress: bool = True,
+    setup_cache: bool = False,
 ):
     if labels is None:
         labels = [k.__name__ for k in kernels]
 
-    timings_s = np.full((len(n_range), len(kernels)), np.nan)
+    if setup_cache:
+        # Memoize setup per n so that repeated n values don't pay for the data
+        # generation again. The cached object is shared between all kernels
+        # and repetitions, so don't use this with kernels that mutate their
+        # input.
+        if callable(setup):
+            setup = functools.lru_cache(maxsize=len(n_range))(setup)
+        elif isinstance(setup, list):
+            setup = [functools.lru_cache(maxsize=len(n_range))(s) for s in setup]
+
+    # Collect the per-n rows in a plain list and coalesce into one array at the
+    # end. This also makes the KeyboardInterrupt truncation trivial: whatever
+    # rows exist are the completed measurements.
+    rows: list[np.ndarray] = []
     cutoff_reached = np.zeros(len(kernels), dtype=bool)
 
-    flop = None if flops is None else np.array([flops(n) for n in n_range])
+    if flops is None:
+        flop = None
+    else:
+        # Most flops callables are elementwise NumPy expressions; evaluate them
+        # on the whole array at once. Fall back to a per-element pass for
+        # callables that only accept scalars, without a list intermediate. The
+        # vectorized call is just an optimization probe: scalar-only callables
+        # can fail on an ndarray with any exception type, so catch them all.
+        n_arr = np.asarray(n_range)
+        try:
+            flop = np.asarray(flops(n_arr), dtype=float)
+            if flop.shape != n_arr.shape:
+                raise ValueError
+        except Exception:
+            flop = np.fromiter(
+                (flops(int(n)) for n in n_range), dtype=float, count=len(n_range)
+            )
 
     task1 = None
     task2 = None
 
     # inner iterator
-    with Progress() as progress:
+    # Throttle the live display; the default 10 redraws per second compete with
+    # the kernels being timed. Without show_progress, skip Progress entirely:
+    # it would still spawn its refresh thread and hook the terminal.
+    progress_cm = (
+        Progress(refresh_per_second=4) if show_progress else contextlib.nullcontext()
+    )
+    with progress_cm as progress:
         try:
             if show_progress:
                 task1 = progress.add_task("Overall", total=len(n_range))
@@ -517,8 +655,8 @@ def bench(
                 callback=callback,
             )
 
-            for i in range(len(n_range)):
-                timings_s[i] = next(b)
+            for _ in range(len(n_range)):
+                rows.append(next(b))
                 # override n_rane in case it got overridden in next()
                 n_range = b.n_range
 
@@ -529,8 +667,14 @@ def bench(
                     progress.reset(task2)
 
         except KeyboardInterrupt:
-            timings_s = timings_s[:i]
-            n_range = n_range[:i]
+            n_range = n_range[: len(rows)]
+
+    if rows:
+        timings_s = np.array(rows)
+        # Free the per-row duplicates before handing the matrix off.
+        del rows
+    else:
+        timings_s = np.empty((0, len(kernels)))
 
     return PerfplotData(n_range, timings_s.T, flop, labels, xlabel, title)
 
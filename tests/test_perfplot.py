@@ -128,6 +128,33 @@ def test_flops():
     )
 
 
+def test_hash_equality_check():
+    perfplot.bench(
+        setup=np.ones,
+        kernels=[lambda a: a + a, lambda a: 2 * a],
+        n_range=r,
+        equality_check="hash",
+    )
+
+
+def test_setup_cache():
+    setup_calls = []
+
+    def setup(n):
+        setup_calls.append(n)
+        return np.ones(n)
+
+    perfplot.bench(
+        setup=setup,
+        kernels=kernels,
+        n_range=[4, 4, 8],
+        setup_cache=True,
+    )
+    # One setup call per distinct n; this relies on Bench.__next__ passing a
+    # plain int, which lru_cache can key on.
+    assert setup_calls == [4, 8]
+
+
 def test_no_setup():
     perfplot.show(kernels=[], n_range=r)
 